@@ -1,6 +1,20 @@
+import functools
+import glob
+import hashlib
+import os
+import pickle
+import sqlite3
+import stat
+import sys
+import tempfile
+import time
+from contextlib import closing
+from pathlib import Path
+
 import streamlit as st
 import pandas as pd
 import numpy as np
+import plotly
 import plotly.express as px
 import matplotlib.pyplot as plt
 import seaborn as sns
@@ -10,6 +24,8 @@ from scipy.stats import skew,chi2_contingency
 # Set-ExecutionPolicy -Scope Process -ExecutionPolicy Bypass
 # .\.venv\Scripts\activate
 # python -m streamlit run Dashboard_EDAFINAL.py
+# Opsional (agregasi via SQLite): set OSADA_DB=osada.db sebelum menjalankan
+# Opsional (cache disk): OSADA_CACHE_DIR, OSADA_CACHE_MAX_MB, OSADA_CACHE_TTL (detik)
 
 # ======================
 # Konfigurasi Dasar App
@@ -85,9 +101,34 @@ st.markdown("---")
 # ======================
 # Load Data
 # ======================
-# ======================
+FILE_DATA = ("data_numerik.csv", "data_kategorikal.csv")
+
+
+def hash_file(path):
+    """sha256 isi file, dibaca per blok."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for blok in iter(lambda: f.read(1 << 20), b""):
+            h.update(blok)
+    return h.hexdigest()
+
+
+def tanda_file(path):
+    """Ukuran + mtime file (None bila tidak ada); murah dihitung, dipakai sebagai kunci cache."""
+    try:
+        info = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return info.st_size, info.st_mtime_ns
+
+
+def tanda_data():
+    return tuple(tanda_file(path) for path in FILE_DATA)
+
+
+# tanda (ukuran, mtime tiap file data) membuat cache dimuat ulang saat CSV berubah
 @st.cache_data
-def load_data():
+def load_data(tanda):
     try:
         df_num = pd.read_csv("data_numerik.csv")
         df_cat = pd.read_csv("data_kategorikal.csv")
@@ -96,14 +137,371 @@ def load_data():
         return None, None
 
 
-df_num, df_cat = load_data()
-if df_num is None or df_cat is None:
-    st.error("❌ Pastikan file data tersedia di direktori kerja.")
-    st.stop()
+def muat_frame():
+    df_num, df_cat = load_data(tanda_data())
+    if df_num is None or df_cat is None:
+        st.error("❌ Pastikan file data tersedia di direktori kerja.")
+        st.stop()
+
+    if "NPM" in df_cat.columns:
+        df_cat["angkatan"] = df_cat["NPM"].astype(str).str[:2]
+    return df_num, df_cat
+
+# ======================
+# Backend SQL Opsional (SQLite)
+# ======================
+# Jika variabel lingkungan OSADA_DB berisi path file SQLite, agregasi
+# (value_counts, groupby per angkatan, crosstab) dijalankan sebagai query GROUP BY.
+# Store dibangun dari CSV (dan dibangun ulang bila isi CSV berubah), lalu dipakai
+# bersama oleh semua proses worker.
+DB_PATH = os.environ.get("OSADA_DB")
+STORE_TMP_KEDALUWARSA = 600  # detik sebelum .tmp build store dianggap sisa build yang crash
+
+KOLOM_KATEGORIKAL = [
+    "1. Dari skala 1–4, seberapa sulit penugasan OSADA menurut Anda?",
+    "2. Jenis kegiatan apa yang paling membantu dalam pengembangan diri Anda selama kegiatan OSADA?",
+    "5. Sejauh mana OSADA membantu Anda dalam meningkatkan kedisiplinan?",
+    "9.  Apakah setelah mengikuti pengkaderan OSADA Anda merasa lebih aktif dalam kegiatan akademik maupun non-akademik di kampus?",
+    "10.  Apakah OSADA memberikan motivasi tambahan bagi Anda untuk aktif dalam organisasi lain di kampus?"
+]
+
+
+def kutip(nama):
+    """Mengutip nama kolom agar aman dipakai di query SQL."""
+    return '"' + nama.replace('"', '""') + '"'
+
+
+def bangun_store(db_path, csv_hash, chunksize=50_000):
+    """Mengimpor data kategorikal ke SQLite per potongan dan membuat indeks."""
+    tmp_path = f"{db_path}.{os.getpid()}.tmp"
+    # Sisa build yang crash dibuang; .tmp milik worker lain yang masih baru dibiarkan
+    # karena mungkin sedang dibangun bersamaan
+    for sisa in glob.glob(glob.escape(db_path) + ".*.tmp"):
+        try:
+            if sisa == tmp_path or time.time() - os.stat(sisa).st_mtime > STORE_TMP_KEDALUWARSA:
+                os.remove(sisa)
+        except OSError:
+            pass
+
+    with closing(sqlite3.connect(tmp_path)) as conn:
+        for chunk in pd.read_csv("data_kategorikal.csv", chunksize=chunksize):
+            if "NPM" in chunk.columns:
+                chunk["angkatan"] = chunk["NPM"].astype(str).str[:2]
+            chunk.to_sql("responden", conn, if_exists="append", index=False)
+
+        kolom_tabel = [row[1] for row in conn.execute("PRAGMA table_info(responden)")]
+        ada_angkatan = "angkatan" in kolom_tabel
+        if ada_angkatan:
+            conn.execute("CREATE INDEX idx_angkatan ON responden (angkatan)")
+        for i, col in enumerate(KOLOM_KATEGORIKAL):
+            if col in kolom_tabel:
+                kolom_indeks = f"{kutip(col)}, angkatan" if ada_angkatan else kutip(col)
+                conn.execute(f"CREATE INDEX idx_kategori_{i} ON responden ({kolom_indeks})")
+        # Hash CSV sumber disimpan agar store bisa dideteksi usang saat data berubah
+        conn.execute("CREATE TABLE meta (kunci TEXT PRIMARY KEY, nilai TEXT)")
+        conn.execute("INSERT INTO meta VALUES ('csv_sha256', ?)", (csv_hash,))
+        conn.commit()
+
+    # Rename atomik: worker lain hanya pernah melihat store yang sudah lengkap
+    os.replace(tmp_path, db_path)
+
+
+def hash_store(db_path):
+    """Hash CSV yang tercatat di store, atau None bila store belum ada/format lama."""
+    if not os.path.exists(db_path):
+        return None
+    uri = Path(db_path).resolve().as_uri() + "?mode=ro"
+    try:
+        with closing(sqlite3.connect(uri, uri=True)) as conn:
+            row = conn.execute("SELECT nilai FROM meta WHERE kunci = 'csv_sha256'").fetchone()
+    except sqlite3.DatabaseError:
+        return None
+    return row[0] if row else None
+
+
+@st.cache_resource
+def siapkan_store(db_path, tanda_csv):
+    # tanda_csv (ukuran, mtime) membuat fungsi ini dijalankan ulang saat CSV berubah;
+    # keputusan rebuild tetap berdasarkan hash isi yang tercatat di tabel meta
+    csv_hash = hash_file("data_kategorikal.csv")
+    if hash_store(db_path) != csv_hash:
+        bangun_store(db_path, csv_hash)
+    return Path(db_path).resolve().as_uri() + "?mode=ro"
+
+
+def query_store(sql):
+    uri = siapkan_store(DB_PATH, tanda_file("data_kategorikal.csv"))
+    with closing(sqlite3.connect(uri, uri=True)) as conn:
+        return pd.read_sql_query(sql, conn)
+
+
+# Mode SQL: frame CSV tidak dimuat di setiap worker; keberadaan kolom dicek lewat
+# skema tabel, dan CSV baru dimuat di halaman yang butuh penjajaran baris df_num–df_cat
+if DB_PATH:
+    if not os.path.exists("data_kategorikal.csv"):
+        st.error("❌ Pastikan file data tersedia di direktori kerja.")
+        st.stop()
+    df_num, df_cat = None, None
+    kolom_data = set(query_store("PRAGMA table_info(responden)")["name"])
+else:
+    df_num, df_cat = muat_frame()
+    kolom_data = set(df_cat.columns)
+
+
+# ======================
+# Cache Disk Persisten
+# ======================
+# Hasil turunan (agregasi, statistik crosstab untuk interpretasi, figure) disimpan di disk dengan
+# kunci hash isi data + kode, sehingga tetap ada setelah restart/redeploy dan
+# dipakai bersama oleh semua proses worker di host yang sama.
+# OSADA_CACHE_DIR="" mematikan cache.
+# Isi cache di-unpickle, jadi siapa pun yang bisa menulis ke direktori ini bisa
+# menjalankan kode di worker. Direktori dibuat dengan mode 0o700 dan harus dimiliki
+# user yang menjalankan Streamlit; bila tidak, cache dimatikan dengan peringatan.
+def angka_env(nama, bawaan):
+    """Membaca angka non-negatif dari variabel lingkungan; nilai tidak valid memakai bawaan."""
+    nilai = os.environ.get(nama)
+    if nilai is None:
+        return bawaan
+    try:
+        angka = float(nilai)
+    except ValueError:
+        angka = -1
+    if not angka >= 0:
+        st.warning(f"⚠️ Nilai {nama}={nilai!r} tidak valid, memakai nilai bawaan {bawaan}.")
+        return bawaan
+    return angka
+
+
+CACHE_DIR = os.environ.get("OSADA_CACHE_DIR", ".osada_cache")
+CACHE_MAX_BYTES = angka_env("OSADA_CACHE_MAX_MB", 256) * 1024 * 1024
+CACHE_TTL = angka_env("OSADA_CACHE_TTL", 7 * 24 * 3600)
+EVIKSI_INTERVAL = 300  # detik antar sapuan eviksi
+TMP_KEDALUWARSA = 600  # detik sebelum .tmp/lock dianggap sisa worker yang mati
+_CACHE_MISS = object()
+
+
+def cache_dir_aman(cache_dir):
+    """Membuat direktori cache (0o700) dan memastikan hanya pemiliknya yang bisa menulis."""
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        info = os.lstat(cache_dir)
+    except OSError:
+        return False
+    if not stat.S_ISDIR(info.st_mode):
+        return False
+    if os.name == "nt":
+        # Bit mode/uid POSIX tidak berlaku di Windows; hak akses diatur lewat ACL
+        return True
+    return info.st_uid == os.getuid() and not info.st_mode & 0o022
+
+
+if CACHE_DIR and not cache_dir_aman(CACHE_DIR):
+    st.warning(f"⚠️ Direktori cache {CACHE_DIR!r} tidak aman atau tidak bisa dibuat (harus milik user ini, mode 0o700); cache disk dimatikan.")
+    CACHE_DIR = ""
+
+
+@st.cache_resource
+def versi_cache(tanda):
+    """Hash isi kode, file data, dan versi Python/library; berubah bila salah satunya berubah."""
+    # tanda sama dengan kunci siapkan_store/load_data, jadi hash dihitung ulang
+    # tepat ketika store atau frame dimuat ulang dari CSV yang berubah
+    h = hashlib.sha256()
+    h.update(hash_file(__file__).encode())
+    for path, tanda_path in zip(FILE_DATA, tanda):
+        # File yang tidak ada (mis. data_numerik.csv di mode SQL, yang hanya dipakai
+        # halaman numerik) dicatat sebagai absen, bukan membuat semua halaman gagal
+        h.update(hash_file(path).encode() if tanda_path is not None else b"absen")
+    h.update(b"sql" if DB_PATH else b"pandas")
+    # requirements.txt tidak mem-pin versi, jadi pickle dari versi library lain tidak dipakai
+    for versi in (sys.version, pd.__version__, plotly.__version__):
+        h.update(versi.encode())
+    return h.hexdigest()
+
+
+def kunci_cache(nama_fungsi, args, kwargs):
+    h = hashlib.sha256()
+    h.update(versi_cache(tanda_data()).encode())
+    h.update(nama_fungsi.encode())
+    # Argumen cukup nama kolom/label; isi data sudah tercakup oleh versi_cache
+    for arg in list(args) + sorted(kwargs.items()):
+        h.update(repr(arg).encode())
+    return h.hexdigest()
+
+
+def hapus_file(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def baca_cache(path):
+    try:
+        info = os.stat(path)
+    except OSError:
+        return _CACHE_MISS
+    if time.time() - info.st_mtime > CACHE_TTL:
+        hapus_file(path)
+        return _CACHE_MISS
+    try:
+        with open(path, "rb") as f:
+            hasil = pickle.load(f)
+    except FileNotFoundError:
+        return _CACHE_MISS
+    except Exception:
+        # Entri rusak atau tidak cocok dengan library saat ini: anggap miss dan buang
+        hapus_file(path)
+        return _CACHE_MISS
+    try:
+        # atime dipakai untuk eviksi LRU; mtime tetap menjadi acuan TTL
+        os.utime(path, (time.time(), info.st_mtime))
+    except OSError:
+        pass
+    return hasil
+
+
+def tulis_cache(path, hasil):
+    try:
+        os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(hasil, f, protocol=pickle.HIGHEST_PROTOCOL)
+        # Rename atomik: pembaca di proses lain tidak pernah melihat file setengah jadi
+        os.replace(tmp_path, path)
+    except (OSError, pickle.PicklingError, TypeError, AttributeError):
+        hapus_file(tmp_path)
+        return
+    eviksi_cache()
+
+
+def perlu_eviksi():
+    penanda = os.path.join(CACHE_DIR, ".eviksi")
+    try:
+        return time.time() - os.stat(penanda).st_mtime > EVIKSI_INTERVAL
+    except FileNotFoundError:
+        return True
+
 
+def eviksi_cache():
+    """Sapuan berkala: paling sering sekali per EVIKSI_INTERVAL, oleh satu worker saja."""
+    if not perlu_eviksi():
+        return
+    # Lock berbasis O_EXCL (portabel, termasuk Windows); worker lain cukup melewati sapuan
+    lock = os.path.join(CACHE_DIR, ".eviksi.lock")
+    try:
+        fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+    except FileExistsError:
+        # Lock milik worker yang mati di tengah sapuan dibuang setelah cukup lama
+        try:
+            if time.time() - os.stat(lock).st_mtime > TMP_KEDALUWARSA:
+                hapus_file(lock)
+        except OSError:
+            pass
+        return
+    except OSError:
+        return
+    os.close(fd)
+    try:
+        sapu_cache()
+        penanda = os.path.join(CACHE_DIR, ".eviksi")
+        with open(penanda, "a"):
+            pass
+        os.utime(penanda)
+    except OSError:
+        pass
+    finally:
+        hapus_file(lock)
+
+
+def sapu_cache():
+    """Membuang entri kedaluwarsa dan .tmp basi, lalu entri tertua (akses terakhir) sampai di bawah batas ukuran."""
+    sekarang = time.time()
+    entri = []
+    for root, _, files in os.walk(CACHE_DIR):
+        for nama in files:
+            path = os.path.join(root, nama)
+            try:
+                info = os.stat(path)
+            except OSError:
+                continue
+            if nama.endswith(".tmp"):
+                # Sisa worker yang mati antara mkstemp dan os.replace
+                if sekarang - info.st_mtime > TMP_KEDALUWARSA:
+                    hapus_file(path)
+            elif nama.endswith(".pkl"):
+                if sekarang - info.st_mtime > CACHE_TTL:
+                    hapus_file(path)
+                else:
+                    entri.append((info.st_atime, info.st_size, path))
+
+    total = sum(size for _, size, _ in entri)
+    for _, size, path in sorted(entri):
+        if total <= CACHE_MAX_BYTES:
+            break
+        hapus_file(path)
+        total -= size
+
+
+def cache_disk(func):
+    """Dekorator cache disk; hasil harus bisa di-pickle."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not CACHE_DIR:
+            return func(*args, **kwargs)
+        kunci = kunci_cache(func.__qualname__, args, kwargs)
+        path = os.path.join(CACHE_DIR, kunci[:2], kunci + ".pkl")
+        hasil = baca_cache(path)
+        if hasil is _CACHE_MISS:
+            hasil = func(*args, **kwargs)
+            tulis_cache(path, hasil)
+        return hasil
+    return wrapper
 
-if "NPM" in df_cat.columns:
-    df_cat["angkatan"] = df_cat["NPM"].astype(str).str[:2]
+# ======================
+# Agregasi Halaman (pandas atau SQL)
+# ======================
+@cache_disk
+def hitung_frekuensi(col):
+    """Frekuensi tiap kategori, terurut menurun (setara value_counts)."""
+    if DB_PATH:
+        c = kutip(col)
+        return query_store(
+            f"SELECT {c} AS nilai, COUNT(*) AS jumlah FROM responden "
+            f"WHERE {c} IS NOT NULL GROUP BY {c} ORDER BY jumlah DESC"
+        )
+    return df_cat[col].value_counts().reset_index()
+
+
+@cache_disk
+def hitung_frekuensi_angkatan(col):
+    """Frekuensi kombinasi kategori dan angkatan (setara groupby([col, 'angkatan']).size())."""
+    if DB_PATH:
+        c = kutip(col)
+        freq = query_store(
+            f"SELECT {c} AS nilai, angkatan, COUNT(*) AS jumlah FROM responden "
+            f"WHERE {c} IS NOT NULL AND angkatan IS NOT NULL "
+            f"GROUP BY {c}, angkatan ORDER BY {c}, angkatan"
+        )
+        return freq.rename(columns={"nilai": col})
+    return df_cat.groupby([col, 'angkatan']).size().reset_index(name='jumlah')
+
+
+@cache_disk
+def hitung_crosstab(x_col, y_col):
+    """Tabel frekuensi silang X terhadap Y (setara pd.crosstab tanpa normalisasi)."""
+    if DB_PATH:
+        x, y = kutip(x_col), kutip(y_col)
+        long = query_store(
+            f"SELECT {x} AS x, {y} AS y, COUNT(*) AS jumlah FROM responden "
+            f"WHERE {x} IS NOT NULL AND {y} IS NOT NULL GROUP BY {x}, {y}"
+        )
+        ct = long.pivot_table(index="x", columns="y", values="jumlah", aggfunc="sum", fill_value=0)
+        return ct.rename_axis(index=x_col, columns=y_col)
+    return pd.crosstab(df_cat[x_col], df_cat[y_col])
 
 # ==============================
 # 🎯 Fungsi Interpretasi Berdasarkan Bentuk Grafik
@@ -249,6 +647,50 @@ def tampilkan_grafik_dengan_interpretasi(fig, text, key):
     st.markdown("---")
 
 
+@cache_disk
+def buat_sunburst(col_name, color_discrete_map, title, singkatan=None):
+    """Sunburst frekuensi kategori per angkatan."""
+    freq = hitung_frekuensi_angkatan(col_name)
+    if singkatan:
+        freq[col_name] = freq[col_name].replace(singkatan)
+    fig_sun = px.sunburst(freq, path=[col_name, 'angkatan'], values='jumlah', color=col_name, color_discrete_map=color_discrete_map, title=title)
+    fig_sun.update_traces(textinfo="label+percent entry")
+    return fig_sun
+
+
+@cache_disk
+def statistik_crosstab(x_col, y_col):
+    """Crosstab persentase per baris X beserta kategori Y yang paling menonjol."""
+    counts = hitung_crosstab(x_col, y_col)
+    crosstab = counts.div(counts.sum(axis=1), axis=0) * 100
+
+    # Hitung rata-rata proporsi tiap kategori Y
+    top_category_y = crosstab.mean().idxmax()
+    top_value_y = crosstab.mean().max()
+
+    # Temukan baris (kategori X) dengan proporsi tertinggi untuk kategori Y tersebut
+    top_x_row = crosstab[top_category_y].idxmax()
+    top_x_value = crosstab.loc[top_x_row, top_category_y]
+    return crosstab, top_category_y, top_value_y, top_x_row, top_x_value
+
+
+@cache_disk
+def buat_bar_crosstab(x_col, y_col):
+    """Stacked bar dari tabel frekuensi silang (bukan data mentah)."""
+    counts = hitung_crosstab(x_col, y_col)
+    bar_df = counts.rename_axis(index='X', columns='Y').stack().reset_index(name='Jumlah')
+    return px.bar(
+        bar_df,
+        x='X',
+        y='Jumlah',
+        color='Y',
+        barmode='stack',
+        labels={'X': x_col, 'Y': y_col},
+        title=f"Distribusi Gabungan: {x_col} vs {y_col}",
+        color_discrete_sequence=px.colors.qualitative.Set2
+    )
+
+
 # ======================
 # Konten Halaman
 # ======================
@@ -290,16 +732,14 @@ elif menu == "📈 Visualisasi & Hasil Analisis":
         }
         st.header("📊 Dampak OSADA terhadap Kedisiplinan")
         col_name = "5. Sejauh mana OSADA membantu Anda dalam meningkatkan kedisiplinan?"
-        if col_name in df_cat.columns:
-            data = df_cat[col_name].value_counts().reset_index()
+        if col_name in kolom_data:
+            data = hitung_frekuensi(col_name)
             data.columns = ['Kategori', 'Jumlah']
             fig = px.pie(data, names='Kategori', values='Jumlah', color='Kategori', title="Distribusi Persepsi Kedisiplinan Mahasiswa", color_discrete_map=color_discrete_map)
             tampilkan_grafik_dengan_interpretasi(fig, "Terlihat dari grafik lingkaran di sebelah, sebagian besar responden menilai OSADA meningkatkan kedisiplinan mereka. Sebanyak 85,7% responden (total jawaban **sangat membantu** dan **membantu**) merasa lebih disiplin setelah mengikuti OSADA. Ini membuktikan bahwa OSADA membawa dampak positif terhadap kedisiplinan mahasiswa.", key="pie_kedisiplinan")
 
-            if 'angkatan' in df_cat.columns:
-                freq = df_cat.groupby([col_name, 'angkatan']).size().reset_index(name='jumlah')
-                fig_sun = px.sunburst(freq, path=[col_name, 'angkatan'], values='jumlah', color=col_name, color_discrete_map=color_discrete_map, title="Kedisiplinan Berdasarkan Angkatan")
-                fig_sun.update_traces(textinfo="label+percent entry")
+            if 'angkatan' in kolom_data:
+                fig_sun = buat_sunburst(col_name, color_discrete_map, "Kedisiplinan Berdasarkan Angkatan")
                 tampilkan_grafik_dengan_interpretasi(fig_sun, "Terlihat dari grafik sunburst di sebelah, dari total 51% jawaban **membantu** angkatan 24 merasa OSADA meningkatkan kedisiplinan mereka dengan persentase 17% diikuti angkatan 22 dengan 13%. Disisi lain jawaban **sangat membantu**, menunjukkan angkatan 23 dengan total 12% dan angkatan 24 dengan total 10%. Hal ini memnunjukkan peningkatan kedisiplinan lebih tinggi terhadap mahasiswa baru yang kemungkinan didukung dengan program OSADA yang baik.", key="sunburst_kedisiplinan")
 
     elif vis_choice == "🤝 Kegiatan yang Paling Membantu Pengembangan Diri":
@@ -317,22 +757,19 @@ elif menu == "📈 Visualisasi & Hasil Analisis":
         }
         st.header("🤝 Kegiatan yang Paling Membantu Pengembangan Diri")
         col_name = "2. Jenis kegiatan apa yang paling membantu dalam pengembangan diri Anda selama kegiatan OSADA?"
-        if col_name in df_cat.columns:
-            data = df_cat[col_name].value_counts().reset_index()
+        if col_name in kolom_data:
+            data = hitung_frekuensi(col_name)
             data.columns = ['Kegiatan', 'Jumlah']
             fig = px.pie(data, names='Kegiatan', values='Jumlah', color='Kegiatan', title="Jenis Kegiatan OSADA yang Paling Membantu Pengembangan Diri", color_discrete_map=color_discrete_map2)
             tampilkan_grafik_dengan_interpretasi(fig, "Terlihat dari grafik lingkaran di sebelah, kegiatan Kerja Kelompok terkait Penugasan OSADA merupakan jenis kegiatan yang paling banyak dipilih responden dengan persentase 38%, diikuti oleh Study Case materi: Etika dan Moral dalam Kehidupan Mahasiswa sebesar 32%. Hal ini menunjukkan bahwa pendekatan menggunakan penugasan kolaborasi kelompok dan pendekatan melalui studi kasus dinilai paling efektif dalam pengembangan diri mahasiswa selama mengikuti OSADA.", key="pie_pengembangan")
 
-            if 'angkatan' in df_cat.columns:
-                freq = df_cat.groupby([col_name, 'angkatan']).size().reset_index(name='jumlah')
-                freq[col_name] = freq[col_name].replace({
+            if 'angkatan' in kolom_data:
+                fig_sun = buat_sunburst(col_name, color_discrete_map2_short, "Kegiatan Pengembangan Diri Berdasarkan Angkatan (Disingkat)", singkatan={
                     'Study Case materi: Etika dan Moral dalam Kehidupan Mahasiswa': 'Study Case',
                     'Kerja Kelompok terkait Penugasan OSADA': 'Kerja Kelompok OSADA',
                     'Penjelasan Materi di kelas': 'Materi di Kelas',
                     'Wawancara HIMASADA': 'Wawancara',
                 })
-                fig_sun = px.sunburst(freq, path=[col_name, 'angkatan'], values='jumlah', color=col_name, color_discrete_map=color_discrete_map2_short, title="Kegiatan Pengembangan Diri Berdasarkan Angkatan (Disingkat)")
-                fig_sun.update_traces(textinfo="label+percent entry")
                 tampilkan_grafik_dengan_interpretasi(fig_sun, "Terlihat dari grafik sunburst di sebelah, angkatan 24 mendominasi partisipasi dalam kegiatan Kerja Kelompok dengan kontribusi 13% dari total responden, diikuti oleh angkatan 23 dan 22 dengan persentase 10%. Distribusi ini mengindikasikan bahwa mahasiswa dari berbagai angkatan memiliki preferensi yang berbeda terhadap jenis kegiatan, namun secara keseluruhan kegiatan kolaboratif tetap menjadi pilihan utama.", key="sunburst_pengembangan")
 
     elif vis_choice == "🔥 Keaktifan setelah Mengikuti OSADA":
@@ -344,16 +781,14 @@ elif menu == "📈 Visualisasi & Hasil Analisis":
         }
         st.header("🔥 Keaktifan setelah Mengikuti OSADA")
         col_name = "9.  Apakah setelah mengikuti pengkaderan OSADA Anda merasa lebih aktif dalam kegiatan akademik maupun non-akademik di kampus?"
-        if col_name in df_cat.columns:
-            data = df_cat[col_name].value_counts().reset_index()
+        if col_name in kolom_data:
+            data = hitung_frekuensi(col_name)
             data.columns = ['Status', 'Jumlah']
             fig = px.pie(data, names='Status', values='Jumlah', color='Status', title="Persepsi Keaktifan Setelah Mengikuti OSADA", color_discrete_map=color_discrete_map3)
             tampilkan_grafik_dengan_interpretasi(fig, "Terlihat dari grafik lingkaran di sebelah, sebanyak 68,2% responden menyatakan merasa aktif dan sangat aktif dalam kegiatan akademik maupun non-akademik setelah mengikuti OSADA. Hanya 22% yang merasa tidak mengalami perubahan signifikan. Data ini membuktikan bahwa OSADA berhasil memotivasi mahasiswa untuk lebih berpartisipasi dalam berbagai kegiatan kampus.", key="pie_keaktifan")
 
-            if 'angkatan' in df_cat.columns:
-                freq = df_cat.groupby([col_name, 'angkatan']).size().reset_index(name='jumlah')
-                fig_sun = px.sunburst(freq, path=[col_name, 'angkatan'], values='jumlah', color=col_name, color_discrete_map=color_discrete_map3, title="Keaktifan Setelah OSADA Berdasarkan Angkatan")
-                fig_sun.update_traces(textinfo="label+percent entry")
+            if 'angkatan' in kolom_data:
+                fig_sun = buat_sunburst(col_name, color_discrete_map3, "Keaktifan Setelah OSADA Berdasarkan Angkatan")
                 tampilkan_grafik_dengan_interpretasi(fig_sun, "Terlihat dari grafik sunburst di sebelah, angkatan 24 menunjukkan tingkat keaktifan tertinggi pasca OSADA dengan kontribusi 18% dari total responden yang merasa aktif, diikuti angkatan 22 sebesar 14%. Yang menarik, mahasiswa angkatan 23 justru lebih banyak menyatakan merasa sangat aktif dengan persentase 5% diikuti angkatan 22 dengan persentase 4%, mengindikasikan bahwa dampak positif OSADA terhadap keaktifan organisasi dapat bertahan hingga tahun-tahun berikutnya.", key="sunburst_keaktifan")
 
 
@@ -366,13 +801,7 @@ elif menu == "🔗 Hubungan Antar Variabel":
         st.info("Analisis distribusi silang antar dua variabel kategori menggunakan stacked bar chart dan interpretasi otomatis.")
 
         # --- Daftar kolom kategorikal yang tersedia ---
-        categorical_columns = [
-            "1. Dari skala 1–4, seberapa sulit penugasan OSADA menurut Anda?",
-            "2. Jenis kegiatan apa yang paling membantu dalam pengembangan diri Anda selama kegiatan OSADA?",
-            "5. Sejauh mana OSADA membantu Anda dalam meningkatkan kedisiplinan?",
-            "9.  Apakah setelah mengikuti pengkaderan OSADA Anda merasa lebih aktif dalam kegiatan akademik maupun non-akademik di kampus?",
-            "10.  Apakah OSADA memberikan motivasi tambahan bagi Anda untuk aktif dalam organisasi lain di kampus?"
-        ]
+        categorical_columns = KOLOM_KATEGORIKAL
 
         # --- Pilih variabel X dan Y untuk analisis ---
         st.subheader("Pilih Variabel untuk Crosstab")
@@ -380,33 +809,18 @@ elif menu == "🔗 Hubungan Antar Variabel":
         y_col = st.selectbox("Variabel Y (pembeda warna di bar chart):", categorical_columns, index=2)
 
         # --- Analisis Crosstab ---
-        if x_col in df_cat.columns and y_col in df_cat.columns:
-            crosstab = pd.crosstab(df_cat[x_col], df_cat[y_col], normalize='index') * 100
+        if x_col in kolom_data and y_col in kolom_data:
+            crosstab, top_category_y, top_value_y, top_x_row, top_x_value = statistik_crosstab(x_col, y_col)
             st.write("**Tabel Crosstab (%):**")
             st.dataframe(crosstab.style.format("{:.1f}%"))
 
             # --- Visualisasi Stacked Bar ---
-            fig = px.bar(
-                df_cat,
-                x=x_col,
-                color=y_col,
-                barmode='stack',
-                title=f"Distribusi Gabungan: {x_col} vs {y_col}",
-                color_discrete_sequence=px.colors.qualitative.Set2
-            )
+            fig = buat_bar_crosstab(x_col, y_col)
             st.plotly_chart(fig, use_container_width=True)
 
             # --- Interpretasi Singkat ---
             st.markdown("### 🧭 Interpretasi Singkat")
 
-            # Hitung rata-rata proporsi tiap kategori Y
-            top_category_y = crosstab.mean().idxmax()
-            top_value_y = crosstab.mean().max()
-
-            # Temukan baris (kategori X) dengan proporsi tertinggi untuk kategori Y tersebut
-            top_x_row = crosstab[top_category_y].idxmax()
-            top_x_value = crosstab.loc[top_x_row, top_category_y]
-
             # Tampilkan interpretasi dengan dua arah (X dan Y)
             st.markdown(f"""
             <div style="text-align: justify; line-height: 1.6;">
@@ -431,6 +845,10 @@ elif menu == "🔗 Hubungan Antar Variabel":
         st.header("🔗 Hubungan Antar Variabel Numerik & Kategorikal")
         st.info("Analisis hubungan antara variabel numerik dan kategorikal untuk melihat pengaruh kegiatan OSADA terhadap perkembangan diri mahasiswa.")
 
+        # Halaman ini menjajarkan df_num dan df_cat per baris, jadi di mode SQL CSV dimuat di sini
+        if df_num is None:
+            df_num, df_cat = muat_frame()
+
         # =====================================================
         # 1️⃣ Waktu OSADA vs Kedisiplinan
         # =====================================================